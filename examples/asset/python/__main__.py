@@ -36,19 +36,20 @@ hero_asset = webflow.Asset("hero-image",
 
 # Example 3: Bulk asset registration
 # NOTE: Replace file_hash values with actual MD5 hashes of your files
-icon_assets = []
+icon_asset_ids = []
 icons = [
-    {"name": "icon-home", "file_name": "home.svg", "file_hash": "11111111111111111111111111111111"},
-    {"name": "icon-settings", "file_name": "settings.svg", "file_hash": "22222222222222222222222222222222"},
-    {"name": "icon-user", "file_name": "user.svg", "file_hash": "33333333333333333333333333333333"},
+    # (resource name, file name, MD5 file hash)
+    ("icon-home", "home.svg", "11111111111111111111111111111111"),
+    ("icon-settings", "settings.svg", "22222222222222222222222222222222"),
+    ("icon-user", "user.svg", "33333333333333333333333333333333"),
 ]
 
-for icon in icons:
-    asset = webflow.Asset(icon["name"],
+for name, file_name, file_hash in icons:
+    asset = webflow.Asset(name,
         site_id=site_id,
-        file_name=icon["file_name"],
-        file_hash=icon["file_hash"])
-    icon_assets.append(asset)
+        file_name=file_name,
+        file_hash=file_hash)
+    icon_asset_ids.append(asset.asset_id)
 
 # Export values for the logo asset
 # These are needed to complete the S3 upload
@@ -63,8 +64,9 @@ pulumi.export("hero_asset_id", hero_asset.asset_id)
 pulumi.export("hero_hosted_url", hero_asset.hosted_url)
 
 # Export icon asset IDs
-pulumi.export("icon_asset_ids", [a.asset_id for a in icon_assets])
+pulumi.export("icon_asset_ids", pulumi.Output.all(*icon_asset_ids))
 
 # Print success message
 asset_count = len(icons) + 2
-site_id.apply(lambda s: print(f"Registered {asset_count} assets for site {s}. Use upload_url and upload_details to complete S3 uploads."))
+print(f"Registering {asset_count} assets. Use upload_url and upload_details to complete S3 uploads.")
+site_id.apply(lambda s: print(f"Target site: {s}"))
@@ -46,7 +46,7 @@ portfolio_collection = webflow.Collection("portfolio-collection",
     slug="portfolio")
 
 # Example 5: Dynamic Collections Based on Config
-environment = config.get("environment") or "development"
+environment = config.get("environment", default="development")
 test_collection = webflow.Collection(f"test-collection-{environment}",
     site_id=site_id,
     display_name=f"Test Collection ({environment})",
@@ -66,13 +66,12 @@ pulumi.export("portfolio_collection_id", portfolio_collection.id)
 pulumi.export("test_collection_id", test_collection.id)
 
 # Export a summary of all collections
-pulumi.export("all_collections", pulumi.Output.all(
-    blog_collection.display_name,
-    products_collection.display_name,
-    team_collection.display_name,
-    portfolio_collection.display_name,
-    test_collection.display_name
-).apply(lambda names: ", ".join(names)))
+pulumi.export("all_collections", pulumi.Output.concat(
+    blog_collection.display_name, ", ",
+    products_collection.display_name, ", ",
+    team_collection.display_name, ", ",
+    portfolio_collection.display_name, ", ",
+    test_collection.display_name))
 
 # Print success message
 site_id.apply(lambda s: print(f"✅ Successfully deployed 5 collections to site {s}"))
@@ -6,7 +6,7 @@ config = pulumi.Config()
 
 # Get configuration values
 collection_id = config.require("collectionId")
-environment = config.get("environment") or "development"
+environment = config.get("environment", default="development")
 
 """
 CollectionItem Example - Creating and Managing CMS Content
@@ -63,7 +63,7 @@ archived_item = webflow.CollectionItem("archived-item",
 
 # Example 4: Bulk Content Creation
 # Create multiple items efficiently using a loop
-bulk_items = []
+bulk_item_id_pairs = []  # one Output of (id, item_id) per item
 content_data = [
     {
         "name": "Introduction to TypeScript",
@@ -92,7 +92,7 @@ for i, data in enumerate(content_data):
             # "category": data["category"],
         },
         is_draft=True)  # Start as drafts
-    bulk_items.append(item)
+    bulk_item_id_pairs.append(pulumi.Output.all(item.id, item.item_id))
 
 # Example 5: Localized Content (optional - only if your site uses localization)
 # Uncomment if your Webflow site has localization enabled
@@ -123,14 +123,15 @@ pulumi.export("published_product_last_updated", published_product.last_updated)
 pulumi.export("archived_item_id", archived_item.id)
 pulumi.export("archived_item_item_id", archived_item.item_id)
 
-# Bulk items exports
-pulumi.export("bulk_item_ids", [item.id for item in bulk_items])
-pulumi.export("bulk_item_item_ids", [item.item_id for item in bulk_items])
+# Bulk items exports: gather the (id, item_id) pairs once and project both lists from them
+bulk_item_pairs = pulumi.Output.all(*bulk_item_id_pairs)
+pulumi.export("bulk_item_ids", bulk_item_pairs.apply(lambda pairs: [p[0] for p in pairs]))
+pulumi.export("bulk_item_item_ids", bulk_item_pairs.apply(lambda pairs: [p[1] for p in pairs]))
 
 # Print deployment success message
-total_items = 3 + len(bulk_items)
+total_items = 3 + len(content_data)
 print(f"✅ Successfully deployed {total_items} collection items to collection {collection_id}")
 print(f"   Environment: {environment}")
-print(f"   Draft items: {1 + len(bulk_items)}")
+print(f"   Draft items: {1 + len(content_data)}")
 print(f"   Published items: 1")
 print(f"   Archived items: 1")
@@ -4,6 +4,9 @@ import pulumi_webflow as webflow
 # Example: Create multiple Webflow sites in a single Pulumi program
 # This demonstrates the basic pattern for managing multiple sites using list comprehension
 
+# robots.txt content shared by every site in the fleet
+_ALLOW_ALL_ROBOTS = "User-agent: *\nAllow: /"
+
 # Define site configurations
 site_configs = [
     {
@@ -43,17 +46,15 @@ sites = [
     for config in site_configs
 ]
 
-# Create robots.txt for each site
-for i, config in enumerate(site_configs):
+# Create robots.txt for each site and export its ID individually
+for config, site in zip(site_configs, sites):
+    name = config["name"]
     webflow.RobotsTxt(
-        f"{config['name']}-robots",
-        site_id=sites[i].id,
-        content="User-agent: *\nAllow: /",
+        f"{name}-robots",
+        site_id=site.id,
+        content=_ALLOW_ALL_ROBOTS,
     )
-
-# Export site IDs individually
-for i, config in enumerate(site_configs):
-    pulumi.export(f"{config['name']}-id", sites[i].id)
+    pulumi.export(f"{name}-id", site.id)
 
 # Export all site IDs as a list
 pulumi.export("all-site-ids", [site.id for site in sites])
@@ -8,6 +8,50 @@ consistency and reducing configuration boilerplate.
 import pulumi_webflow as webflow
 
 
+def _short_name(name: str) -> str:
+    """Return the site short name for a template name, e.g. "Q1 Promo" -> "q1-promo"."""
+    if name.islower() and " " not in name:
+        # Already normalized (the common case), so skip the string copies
+        return name
+    return name.lower().replace(" ", "-")
+
+
+# Standard robots.txt content shared by every site built from a template
+_ALLOW_ALL_ROBOTS = "User-agent: *\nAllow: /"
+_EVENT_ROBOTS = "User-agent: *\nAllow: /\nDisallow: /admin/"
+
+# Standard redirects per template: (resource suffix, source, destination, status)
+_CAMPAIGN_REDIRECTS = (
+    ("home", "/home", "/", 301),
+    ("signup", "/join", "/signup", 302),
+)
+
+_PRODUCT_REDIRECTS = (
+    ("pricing", "/price", "/pricing", 301),
+    ("demo", "/try", "/request-demo", 302),
+    ("docs", "/help", "/documentation", 301),
+)
+
+_EVENT_REDIRECTS = (
+    ("register", "/signup", "/register", 301),
+    ("agenda", "/schedule", "/agenda", 301),
+    ("speakers", "/presenters", "/speakers", 301),
+    ("tickets", "/buy", "/tickets", 301),
+)
+
+
+def _create_redirects(name: str, site: webflow.Site, redirects) -> None:
+    """Create a template's standard redirects for a site."""
+    for suffix, source_path, destination_path, status_code in redirects:
+        webflow.Redirect(
+            f"{name}-{suffix}-redirect",
+            site_id=site.id,
+            source_path=source_path,
+            destination_path=destination_path,
+            status_code=status_code,
+        )
+
+
 def create_campaign_site(name: str, display_name: str) -> webflow.Site:
     """Create a standardized campaign site with default configurations.
 
@@ -22,32 +66,18 @@ def create_campaign_site(name: str, display_name: str) -> webflow.Site:
     site = webflow.Site(
         name,
         display_name=display_name,
-        short_name=name.lower().replace(" ", "-"),
+        short_name=_short_name(name),
     )
 
     # Standard robots.txt for campaigns (allow all)
     webflow.RobotsTxt(
         f"{name}-robots",
         site_id=site.id,
-        content="User-agent: *\nAllow: /",
+        content=_ALLOW_ALL_ROBOTS,
     )
 
     # Standard campaign redirects
-    webflow.Redirect(
-        f"{name}-home-redirect",
-        site_id=site.id,
-        source_path="/home",
-        destination_path="/",
-        status_code=301,
-    )
-
-    webflow.Redirect(
-        f"{name}-signup-redirect",
-        site_id=site.id,
-        source_path="/join",
-        destination_path="/signup",
-        status_code=302,
-    )
+    _create_redirects(name, site, _CAMPAIGN_REDIRECTS)
 
     return site
 
@@ -66,40 +96,18 @@ def create_product_site(name: str, display_name: str) -> webflow.Site:
     site = webflow.Site(
         name,
         display_name=display_name,
-        short_name=name.lower().replace(" ", "-"),
+        short_name=_short_name(name),
     )
 
     # Product-specific robots.txt (allow all for indexing)
     webflow.RobotsTxt(
         f"{name}-robots",
         site_id=site.id,
-        content="User-agent: *\nAllow: /",
+        content=_ALLOW_ALL_ROBOTS,
     )
 
     # Standard product page redirects
-    webflow.Redirect(
-        f"{name}-pricing-redirect",
-        site_id=site.id,
-        source_path="/price",
-        destination_path="/pricing",
-        status_code=301,
-    )
-
-    webflow.Redirect(
-        f"{name}-demo-redirect",
-        site_id=site.id,
-        source_path="/try",
-        destination_path="/request-demo",
-        status_code=302,
-    )
-
-    webflow.Redirect(
-        f"{name}-docs-redirect",
-        site_id=site.id,
-        source_path="/help",
-        destination_path="/documentation",
-        status_code=301,
-    )
+    _create_redirects(name, site, _PRODUCT_REDIRECTS)
 
     return site
 
@@ -118,47 +126,17 @@ def create_event_site(name: str, display_name: str) -> webflow.Site:
     site = webflow.Site(
         name,
         display_name=display_name,
-        short_name=name.lower().replace(" ", "-"),
+        short_name=_short_name(name),
     )
 
     # Event-specific robots.txt
     webflow.RobotsTxt(
         f"{name}-robots",
         site_id=site.id,
-        content="User-agent: *\nAllow: /\nDisallow: /admin/",
+        content=_EVENT_ROBOTS,
     )
 
     # Event registration redirects
-    webflow.Redirect(
-        f"{name}-register-redirect",
-        site_id=site.id,
-        source_path="/signup",
-        destination_path="/register",
-        status_code=301,
-    )
-
-    webflow.Redirect(
-        f"{name}-agenda-redirect",
-        site_id=site.id,
-        source_path="/schedule",
-        destination_path="/agenda",
-        status_code=301,
-    )
-
-    webflow.Redirect(
-        f"{name}-speakers-redirect",
-        site_id=site.id,
-        source_path="/presenters",
-        destination_path="/speakers",
-        status_code=301,
-    )
-
-    webflow.Redirect(
-        f"{name}-tickets-redirect",
-        site_id=site.id,
-        source_path="/buy",
-        destination_path="/tickets",
-        status_code=301,
-    )
+    _create_redirects(name, site, _EVENT_REDIRECTS)
 
     return site
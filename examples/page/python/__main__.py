@@ -15,6 +15,9 @@ This example demonstrates how to read page information from a Webflow site.
 Pages cannot be created via the API - they must be created in the Webflow designer.
 """
 
+# PageData is a read-only resource rather than an invoke, so registering it does
+# not block the program: the engine reads both page queries concurrently.
+
 # Example 1: Get all pages for a site
 all_pages = webflow.PageData("all-pages",
     site_id=site_id)
@@ -27,22 +30,25 @@ if page_id:
         page_id=page_id)
 
 # Export outputs for all pages scenario
-def transform_pages(pages):
-    """Transform pages array into readable format"""
-    return [
-        {
+def summarize_pages(pages):
+    """Transform pages array into readable format, collecting IDs in the same pass"""
+    transformed = []
+    ids = []
+    for page in pages:
+        ids.append(page.page_id)
+        transformed.append({
             "id": page.page_id,
             "title": page.title,
             "slug": page.slug,
             "draft": page.draft,
             "archived": page.archived,
-        }
-        for page in pages
-    ]
+        })
+    return {"transformed": transformed, "count": len(pages), "ids": ids}
 
-pulumi.export("site_pages", all_pages.pages.apply(transform_pages))
-pulumi.export("page_count", all_pages.pages.apply(lambda pages: len(pages)))
-pulumi.export("page_ids", all_pages.pages.apply(lambda pages: [p.page_id for p in pages]))
+pages_summary = all_pages.pages.apply(summarize_pages)
+pulumi.export("site_pages", pages_summary["transformed"])
+pulumi.export("page_count", pages_summary["count"])
+pulumi.export("page_ids", pages_summary["ids"])
 
 # Export outputs for specific page scenario (if configured)
 if specific_page:
@@ -70,7 +76,14 @@ def print_pages_info(pages):
         if len(pages) > sample_size:
             print(f"  ... and {len(pages) - sample_size} more")
 
-all_pages.pages.apply(print_pages_info)
+def print_summary(pages, title=None):
+    print_pages_info(pages)
+    if title is not None:
+        print(f"\n✅ Retrieved page: \"{title}\"")
 
+# Print everything from a single callback once all page data has resolved
+summary_inputs = [all_pages.pages]
 if specific_page:
-    specific_page.title.apply(lambda title: print(f"\n✅ Retrieved page: \"{title}\""))
+    summary_inputs.append(specific_page.title)
+
+pulumi.Output.all(*summary_inputs).apply(lambda values: print_summary(*values))
@@ -35,28 +35,30 @@ external_redirect = webflow.Redirect("external-partner-link",
     status_code=301)
 
 # Example 4: Bulk Redirects
-bulk_redirects = []
+bulk_redirect_ids = []
 redirect_mappings = [
-    {"old": "/product-a", "new": "/products/product-a"},
-    {"old": "/product-b", "new": "/products/product-b"},
-    {"old": "/product-c", "new": "/products/product-c"},
+    # (old path, new path)
+    ("/product-a", "/products/product-a"),
+    ("/product-b", "/products/product-b"),
+    ("/product-c", "/products/product-c"),
 ]
 
-for i, mapping in enumerate(redirect_mappings):
+for i, (old_path, new_path) in enumerate(redirect_mappings):
     redirect = webflow.Redirect(f"bulk-redirect-{i}",
         site_id=site_id,
-        source_path=mapping["old"],
-        destination_path=mapping["new"],
+        source_path=old_path,
+        destination_path=new_path,
         status_code=301)
-    bulk_redirects.append(redirect)
+    bulk_redirect_ids.append(redirect.id)
 
 # Export values
 pulumi.export("deployed_site_id", site_id)
 pulumi.export("permanent_redirect_id", permanent_redirect.id)
 pulumi.export("temporary_redirect_id", temporary_redirect.id)
 pulumi.export("external_redirect_id", external_redirect.id)
-pulumi.export("bulk_redirect_ids", [r.id for r in bulk_redirects])
+pulumi.export("bulk_redirect_ids", pulumi.Output.all(*bulk_redirect_ids))
 
 # Print success message
-redirect_count = len(bulk_redirects) + 3
-site_id.apply(lambda s: print(f"✅ Deployed {redirect_count} redirects to site {s}"))
+redirect_count = len(bulk_redirect_ids) + 3
+print(f"✅ Deploying {redirect_count} redirects")
+site_id.apply(lambda s: print(f"   Target site: {s}"))
@@ -12,9 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from dataclasses import dataclass, field
+
 import pulumi
 import webflow_webflow as webflow
 
+# Environments this program may deploy to (ordered for error messages)
+ENVIRONMENTS = ("dev", "staging", "prod")
+VALID_ENVIRONMENTS = frozenset(ENVIRONMENTS)
+
+# Environments that need an explicit confirmation, mapped to a display label
+# and the config key that must be set to "yes" before deploying
+STRICT_ENVIRONMENTS = {"prod": ("Production", "prodDeploymentConfirmed")}
+
+
+@dataclass
+class SiteConfig:
+    """Settings for one entry of the stack's `sites` config object."""
+
+    display_name: str
+    short_name: str
+    allow_indexing: bool = False
+    redirects: list = field(default_factory=list)
+
+
 # Load configuration from current stack
 config = pulumi.Config()
 
@@ -22,51 +43,74 @@ config = pulumi.Config()
 environment_name = config.require("environmentName")  # "dev", "staging", "prod"
 
 # Validate environment configuration to prevent mistakes
-valid_environments = ["dev", "staging", "prod"]
-if environment_name not in valid_environments:
+if environment_name not in VALID_ENVIRONMENTS:
     raise ValueError(
         f"Invalid environment '{environment_name}'. "
-        f"Must be one of: {', '.join(valid_environments)}"
+        f"Must be one of: {', '.join(ENVIRONMENTS)}"
     )
 
 # Production safety check
-is_prod = environment_name == "prod"
-if is_prod:
-    confirmation = config.get("prodDeploymentConfirmed")
-    if confirmation != "yes":
+strict = STRICT_ENVIRONMENTS.get(environment_name)
+if strict:
+    label, confirm_key = strict
+    if config.get(confirm_key) != "yes":
         raise RuntimeError(
-            "⚠️  Production deployment requires explicit confirmation.\n"
-            "Run: pulumi config set prodDeploymentConfirmed yes\n"
-            "This prevents accidental production deployments."
+            f"⚠️  {label} deployment requires explicit confirmation.\n"
+            f"Run: pulumi config set {confirm_key} yes\n"
+            f"This prevents accidental {label.lower()} deployments."
         )
 
 # Load site configurations from stack config
 # Each site is a distinct entity with its own purpose and settings
 sites_config = config.require_object("sites")
 
+# Validate every site entry up front, so a missing key fails before any
+# resource is registered
+site_configs = {
+    site_key: SiteConfig(
+        display_name=site_config["displayName"],
+        short_name=site_config["shortName"],
+        allow_indexing=site_config.get("allowIndexing", False),
+        redirects=site_config.get("redirects", []),
+    )
+    for site_key, site_config in sites_config.items()
+}
+
 pulumi.log.info(
-    f"🚀 Deploying {len(sites_config)} sites to {environment_name} environment"
+    f"🚀 Deploying {len(site_configs)} sites to {environment_name} environment"
 )
 
-# Create each configured site
-site_exports = {}
+# robots.txt content for indexed and non-indexed sites in this environment
+allow_robots_content = "User-agent: *\nAllow: /\n"
+disallow_robots_content = (
+    f"User-agent: *\nDisallow: /\n\n# {environment_name.upper()} - Do not index"
+)
 
-for site_key, site_config in sites_config.items():
+# Phase 1: register every site up front. Sites have no dependencies on each
+# other, so the engine can start creating all of them right away.
+site_ids = {}
+site_names = []
+sites = []
+
+for site_key, site_config in site_configs.items():
     # Create the site with its specific configuration
     site = webflow.Site(
         site_key,
-        display_name=site_config["displayName"],
-        short_name=site_config["shortName"],
+        display_name=site_config.display_name,
+        short_name=site_config.short_name,
     )
 
-    site_exports[f"{site_key}-id"] = site.id
+    site_ids[site_key] = site.id
+    site_names.append(site_key)
+    sites.append((site_key, site_config, site))
 
+# Phase 2: register each site's dependent resources
+for site_key, site_config, site in sites:
     # Configure robots.txt based on site's indexing preference
-    allow_indexing = site_config.get("allowIndexing", False)
     robots_content = (
-        "User-agent: *\nAllow: /\n"
-        if allow_indexing
-        else f"User-agent: *\nDisallow: /\n\n# {environment_name.upper()} - Do not index"
+        allow_robots_content
+        if site_config.allow_indexing
+        else disallow_robots_content
     )
 
     webflow.RobotsTxt(
@@ -76,30 +120,29 @@ for site_key, site_config in sites_config.items():
     )
 
     # Create any configured redirects for this site
-    redirects = site_config.get("redirects", [])
-    for redirect in redirects:
-        redirect_name = f"{site_key}-redirect{redirect['sourcePath'].replace('/', '-')}"
+    redirect_prefix = f"{site_key}-redirect"
+    for redirect in site_config.redirects:
+        source_path = redirect["sourcePath"]
         webflow.Redirect(
-            redirect_name,
+            redirect_prefix + source_path.replace("/", "-"),
             site_id=site.id,
-            source_path=redirect["sourcePath"],
+            source_path=source_path,
             destination_path=redirect["destinationPath"],
             status_code=redirect["statusCode"],
         )
 
-    pulumi.log.info(f"✅ Configured site: {site_key} ({site_config['displayName']})")
+    pulumi.log.info(f"✅ Configured site: {site_key} ({site_config.display_name})")
 
-# Export site IDs for reference
-for key, value in site_exports.items():
-    pulumi.export(key, value)
+# Export site IDs for reference as a single map output keyed by site
+pulumi.export("siteIds", site_ids)
 
 # Export summary information
 pulumi.export("environment", environment_name)
-pulumi.export("siteCount", len(sites_config))
-pulumi.export("siteNames", list(sites_config.keys()))
+pulumi.export("siteCount", len(site_names))
+pulumi.export("siteNames", site_names)
 pulumi.export("stackName", pulumi.get_stack())
 pulumi.export("projectName", pulumi.get_project())
 
 pulumi.log.info(
-    f"✅ Deployment complete: {len(sites_config)} sites configured for {environment_name}"
+    f"✅ Deployment complete: {len(site_names)} sites configured for {environment_name}"
 )
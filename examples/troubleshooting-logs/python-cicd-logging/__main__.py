@@ -49,20 +49,18 @@ site = webflow.Site(
 
 pulumi.log.debug(f"Site creation request submitted (details redacted)")
 
-# Configure robots.txt with environment-specific settings
-site_id = site.id.apply(lambda id: id)
+# Environment-specific robots.txt content (depends only on the environment)
+if environment == "prod":
+    robots_content = "User-agent: *\nAllow: /\n"
+    pulumi.log.debug("Using production robots.txt (allow all)")
+else:
+    robots_content = f"User-agent: *\nDisallow: /\n\n# {environment.upper()} ENVIRONMENT - NOT FOR INDEXING"
+    pulumi.log.debug(f"Using {environment} robots.txt (disallow all)")
 
+# Configure robots.txt with environment-specific settings
 def configure_robots(site_id):
     pulumi.log.info(f"🤖 Configuring robots.txt for site: {site_id}")
 
-    # Environment-specific robots.txt content
-    if environment == "prod":
-        robots_content = "User-agent: *\nAllow: /\n"
-        pulumi.log.debug("Using production robots.txt (allow all)")
-    else:
-        robots_content = f"User-agent: *\nDisallow: /\n\n# {environment.upper()} ENVIRONMENT - NOT FOR INDEXING"
-        pulumi.log.debug(f"Using {environment} robots.txt (disallow all)")
-
     robots = webflow.RobotsTxt(
         f"{environment}-robots",
         site_id=site_id,
@@ -72,7 +70,7 @@ def configure_robots(site_id):
     pulumi.log.info(f"✅ Robots.txt configured for {environment} environment")
     return robots
 
-robots = site_id.apply(configure_robots)
+robots = site.id.apply(configure_robots)
 
 # Export results
 pulumi.export("site_id", site.id)
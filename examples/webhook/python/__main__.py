@@ -5,7 +5,7 @@ import pulumi_webflow as webflow
 config = pulumi.Config()
 
 # Get configuration values
-site_id = config.require_secret("siteId")
+site_id = config.require("siteId")  # Site IDs are identifiers, not credentials
 
 """
 Webhook Example - Creating and Managing Webflow Webhooks
@@ -14,62 +14,46 @@ This example demonstrates how to set up webhooks for your Webflow sites.
 Webhooks allow you to receive real-time notifications when events occur.
 """
 
-# Example 1: Form Submission Webhook
-# Receive notifications when users submit forms on your site
-form_webhook = webflow.Webhook("form-submission-webhook",
-    site_id=site_id,
-    trigger_type="form_submission",
-    url="https://your-api.example.com/webhooks/webflow/forms")
-
-# Example 2: Site Publish Webhook
-# Get notified when your site is published
-publish_webhook = webflow.Webhook("site-publish-webhook",
-    site_id=site_id,
-    trigger_type="site_publish",
-    url="https://your-api.example.com/webhooks/webflow/publish")
-
-# Example 3: E-commerce Order Webhook
-# Track new orders in your Webflow e-commerce store
-ecomm_webhook = webflow.Webhook("ecomm-order-webhook",
-    site_id=site_id,
-    trigger_type="ecomm_new_order",
-    url="https://your-api.example.com/webhooks/webflow/orders")
-
-# Example 4: Collection Item Webhook with Filter
-# Monitor changes to specific collection items
-# Note: Replace "your-collection-id-here" with an actual collection ID
-collection_webhook = webflow.Webhook("collection-item-webhook",
-    site_id=site_id,
-    trigger_type="collection_item_created",
-    url="https://your-api.example.com/webhooks/webflow/collection",
-    filter={
-        "collectionIds": ["your-collection-id-here"]
-    })
-
-# Example 5: Page Metadata Update Webhook
-# Track when page metadata changes (title, description, SEO settings)
-page_metadata_webhook = webflow.Webhook("page-metadata-webhook",
-    site_id=site_id,
-    trigger_type="page_metadata_updated",
-    url="https://your-api.example.com/webhooks/webflow/pages")
-
-# Example 6: Membership User Account Webhook
-# Monitor user account creation in Webflow Memberships
-membership_webhook = webflow.Webhook("membership-webhook",
-    site_id=site_id,
-    trigger_type="memberships_user_account_added",
-    url="https://your-api.example.com/webhooks/webflow/members")
-
-# Export webhook IDs and timestamps for reference
+# Webhook definitions: (export key, resource name, trigger type, URL, filter)
+WEBHOOKS = [
+    # Form Submission: receive notifications when users submit forms on your site
+    ("form", "form-submission-webhook", "form_submission",
+     "https://your-api.example.com/webhooks/webflow/forms", None),
+    # Site Publish: get notified when your site is published
+    ("publish", "site-publish-webhook", "site_publish",
+     "https://your-api.example.com/webhooks/webflow/publish", None),
+    # E-commerce Order: track new orders in your Webflow e-commerce store
+    ("ecomm", "ecomm-order-webhook", "ecomm_new_order",
+     "https://your-api.example.com/webhooks/webflow/orders", None),
+    # Collection Item with Filter: monitor changes to specific collection items
+    # Note: Replace "your-collection-id-here" with an actual collection ID
+    ("collection", "collection-item-webhook", "collection_item_created",
+     "https://your-api.example.com/webhooks/webflow/collection",
+     {"collectionIds": ["your-collection-id-here"]}),
+    # Page Metadata Update: track when page metadata changes (title, description, SEO settings)
+    ("pageMetadata", "page-metadata-webhook", "page_metadata_updated",
+     "https://your-api.example.com/webhooks/webflow/pages", None),
+    # Membership User Account: monitor user account creation in Webflow Memberships
+    ("membership", "membership-webhook", "memberships_user_account_added",
+     "https://your-api.example.com/webhooks/webflow/members", None),
+]
+
+# Create every webhook back to back from the table above
+webhooks = {
+    key: webflow.Webhook(name,
+        site_id=site_id,
+        trigger_type=trigger_type,
+        url=url,
+        filter=event_filter)
+    for key, name, trigger_type, url, event_filter in WEBHOOKS
+}
+
+# Export webhook IDs and timestamps for reference as a single map output
 pulumi.export("deployed_site_id", site_id)
-pulumi.export("form_webhook_id", form_webhook.id)
-pulumi.export("form_webhook_created", form_webhook.created_on)
-pulumi.export("publish_webhook_id", publish_webhook.id)
-pulumi.export("ecomm_webhook_id", ecomm_webhook.id)
-pulumi.export("collection_webhook_id", collection_webhook.id)
-pulumi.export("page_metadata_webhook_id", page_metadata_webhook.id)
-pulumi.export("membership_webhook_id", membership_webhook.id)
+webhook_exports = {key: {"id": webhook.id} for key, webhook in webhooks.items()}
+webhook_exports["form"]["created"] = webhooks["form"].created_on
+pulumi.export("webhooks", webhook_exports)
 
-# Print success message
-webhook_count = 6
-site_id.apply(lambda s: print(f"✅ Deployed {webhook_count} webhooks to site {s}"))
+# Log success message
+webhook_count = len(webhooks)
+pulumi.log.info(f"✅ Deploying {webhook_count} webhooks to site {site_id}")
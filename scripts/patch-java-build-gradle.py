@@ -9,7 +9,9 @@ filled in for Maven Central compliance. This script patches the file with:
 - Proper GPG signing configuration (3-param useInMemoryPgpKeys)
 """
 
+import os
 import re
+import shutil
 import sys
 from pathlib import Path
 
@@ -19,6 +21,135 @@ class PatchError(Exception):
     pass
 
 
+# The file is patched as raw bytes: everything matched or inserted below is
+# ASCII, so there is no need to decode and re-encode the whole file.
+
+# Placeholder values emitted by pulumi-java-gen that are always replaced verbatim.
+# They are applied together in a single pass over the file (see _LITERAL_RE).
+_LITERAL_REPLACEMENTS = {
+    b'artifactId = "webflow"': b'artifactId = "pulumi-webflow"',
+    b'inceptionYear = ""': b'inceptionYear = "2025"',
+    b'url = "https://example.com"': b'url = "https://github.com/jdetmar/pulumi-webflow"',
+    b'connection = "https://example.com"': b'connection = "scm:git:git://github.com/jdetmar/pulumi-webflow.git"',
+    b'developerConnection = "https://example.com"': b'developerConnection = "scm:git:ssh://github.com:jdetmar/pulumi-webflow.git"',
+    # Signing needs the 3-parameter form for Maven Central
+    b'useInMemoryPgpKeys(signingKey, signingPassword)': b'useInMemoryPgpKeys(signingKeyId, signingKey, signingPassword)',
+}
+
+_LITERAL_RE = re.compile(b'|'.join(re.escape(literal) for literal in _LITERAL_REPLACEMENTS))
+
+# Default for publishStagingURL: Maven Central Portal's staging API (not legacy OSSRH)
+# See: https://central.sonatype.org/publish/publish-portal-api/
+_STAGING_URL_DEF = b'def publishStagingURL = System.getenv("PUBLISH_STAGING_URL")'
+_STAGING_URL_DEFAULT = b' ?: "https://ossrh-staging-api.central.sonatype.com/service/local/"'
+
+_REPO_URL_DEF = b'def publishRepoURL = System.getenv("PUBLISH_REPO_URL")'
+_REPO_URL_DEFAULT = b' ?: "https://central.sonatype.com/repository/maven-snapshots/"'
+
+# Present only once the script has patched a file; when all are found the file
+# is treated as already patched and none of the patch passes run.
+_PATCHED_MARKERS = (
+    b'io.github.gradle-nexus.publish-plugin',
+    b'useInMemoryPgpKeys(signingKeyId,',
+    b'artifactId = "pulumi-webflow"',
+    b'nexusPublishing {',
+)
+
+_BRACE_RE = re.compile(rb'[{}]')
+
+# Whitespace after a closing brace, up to and including its last newline
+_TRAILING_BLANK_LINES_RE = re.compile(rb'\s*\n')
+
+
+def _find_block_end(content: bytes, start: int) -> int:
+    """
+    Return the index just past the ``}`` that closes the first ``{`` at or after ``start``.
+
+    Braces are balanced in one forward scan over the brace characters, so nested
+    blocks are handled and nothing is matched twice. Returns -1 if the block is
+    never closed.
+    """
+    depth = 0
+    for match in _BRACE_RE.finditer(content, start):
+        if match.group() == b'{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return -1
+
+
+def _patch_declarations(content: bytes) -> bytes:
+    """
+    Patch the plugin list and the top-level ``def`` variables of build.gradle.
+
+    Every edit here touches a single statement line, so the file is split into
+    lines once, matching lines are rewritten in place and the result is joined
+    once at the end.
+    """
+    add_nexus_plugin = b'io.github.gradle-nexus.publish-plugin' not in content
+    add_signing_key_id = b'def signingKeyId' not in content
+    add_staging_url = b'def publishStagingURL' not in content
+
+    lines = content.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        # Add nexus publish plugin if not present
+        if add_nexus_plugin and b'id("maven-publish")' in line:
+            lines[i] = line.replace(
+                b'id("maven-publish")',
+                b'id("maven-publish")\n    id("io.github.gradle-nexus.publish-plugin") version "2.0.0"'
+            )
+
+        # Add signingKeyId variable if not present
+        elif add_signing_key_id and b'def signingKey = System.getenv("SIGNING_KEY")' in line:
+            lines[i] = b'def signingKeyId = System.getenv("SIGNING_KEY_ID")\n' + line
+
+        # Add publishStagingURL with default if not present
+        elif add_staging_url and b'def publishRepoUsername = System.getenv("PUBLISH_REPO_USERNAME")' in line:
+            lines[i] = _STAGING_URL_DEF + _STAGING_URL_DEFAULT + b'\n' + line
+
+        # publishStagingURL exists but without default value
+        elif _STAGING_URL_DEF in line and b'?:' not in line:
+            lines[i] = line.replace(_STAGING_URL_DEF, _STAGING_URL_DEF + _STAGING_URL_DEFAULT)
+
+        # Update publishRepoURL default to Maven Central snapshots (only if no default exists)
+        elif _REPO_URL_DEF in line and b'?:' not in line:
+            lines[i] = line.replace(_REPO_URL_DEF, _REPO_URL_DEF + _REPO_URL_DEFAULT)
+
+    return b''.join(lines)
+
+
+def _patch_in_block(content: bytes, blocks: tuple, field: bytes, value: bytes) -> bytes:
+    """
+    Fill in the first empty ``field = ""`` placeholder inside nested ``blocks``.
+
+    For ``blocks=(b'licenses', b'license')`` this finds ``licenses {``, then
+    ``license {`` after it, then the placeholder after that. The placeholder
+    only counts if no ``}`` appears between the outer block opening and the
+    placeholder, so it is still inside the opened blocks. Only linear
+    ``bytes.find`` scans are used, so there is no regex backtracking.
+
+    Returns the content unchanged if the placeholder is not found.
+    """
+    block_start = content.find(blocks[0] + b' {')
+    if block_start < 0:
+        return content
+
+    pos = block_start
+    for block in blocks[1:]:
+        pos = content.find(block + b' {', pos + 1)
+        if pos < 0:
+            return content
+
+    placeholder = field + b' = ""'
+    pos = content.find(placeholder, pos)
+    if pos < 0 or content.find(b'}', block_start, pos) >= 0:
+        return content
+
+    return b'%s%s = "%s"%s' % (content[:pos], field, value, content[pos + len(placeholder):])
+
+
 def patch_build_gradle(filepath: str) -> None:
     """
     Patch the generated build.gradle file with Maven Central publishing configuration.
@@ -37,128 +168,37 @@ def patch_build_gradle(filepath: str) -> None:
         raise FileNotFoundError(f"build.gradle not found: {filepath}")
 
     try:
-        content = path.read_text(encoding='utf-8')
+        content = path.read_bytes()
     except PermissionError:
         raise PermissionError(f"Cannot read build.gradle (permission denied): {filepath}")
 
+    if all(marker in content for marker in _PATCHED_MARKERS):
+        print(f"No changes needed for {filepath} (already patched)")
+        return
+
     original_content = content
 
-    # Add nexus publish plugin if not present
-    if 'io.github.gradle-nexus.publish-plugin' not in content:
-        content = content.replace(
-            'id("maven-publish")',
-            'id("maven-publish")\n    id("io.github.gradle-nexus.publish-plugin") version "2.0.0"'
-        )
-
-    # Add signingKeyId variable if not present
-    if 'def signingKeyId' not in content:
-        content = content.replace(
-            'def signingKey = System.getenv("SIGNING_KEY")',
-            'def signingKeyId = System.getenv("SIGNING_KEY_ID")\ndef signingKey = System.getenv("SIGNING_KEY")'
-        )
-
-    # Add publishStagingURL with default if not present or missing default
-    # Note: The staging URL is for Maven Central Portal's staging API (not legacy OSSRH)
-    # See: https://central.sonatype.org/publish/publish-portal-api/
-    staging_url = "https://ossrh-staging-api.central.sonatype.com/service/local/"
-
-    if 'def publishStagingURL' not in content:
-        content = content.replace(
-            'def publishRepoUsername = System.getenv("PUBLISH_REPO_USERNAME")',
-            f'def publishStagingURL = System.getenv("PUBLISH_STAGING_URL") ?: "{staging_url}"\ndef publishRepoUsername = System.getenv("PUBLISH_REPO_USERNAME")'
-        )
-    elif 'def publishStagingURL' in content:
-        # publishStagingURL exists; check if it already has a default value
-        after_def = content.split('def publishStagingURL', 1)[1]
-        first_line = after_def.split('\n', 1)[0] if '\n' in after_def else after_def
-        if '?:' not in first_line:
-            # publishStagingURL exists but without default value
-            content = content.replace(
-                'def publishStagingURL = System.getenv("PUBLISH_STAGING_URL")',
-                f'def publishStagingURL = System.getenv("PUBLISH_STAGING_URL") ?: "{staging_url}"'
-            )
+    # Add the nexus plugin and the signing/publishing variables in one pass over the lines
+    content = _patch_declarations(content)
 
-    # Update publishRepoURL default to Maven Central snapshots (only if no default exists)
-    content = re.sub(
-        r'def publishRepoURL = System\.getenv\("PUBLISH_REPO_URL"\)(?!\s*\?:)',
-        'def publishRepoURL = System.getenv("PUBLISH_REPO_URL") ?: "https://central.sonatype.com/repository/maven-snapshots/"',
-        content
-    )
-
-    # Fix artifactId
-    content = content.replace(
-        'artifactId = "webflow"',
-        'artifactId = "pulumi-webflow"'
-    )
-
-    # Fix inceptionYear
-    content = content.replace(
-        'inceptionYear = ""',
-        'inceptionYear = "2025"'
-    )
+    # Fix artifactId, inceptionYear, URL placeholders and the signing call
+    content = _LITERAL_RE.sub(lambda m: _LITERAL_REPLACEMENTS[m.group()], content)
 
     # Fix pom name - be specific to avoid matching other name fields
-    content = re.sub(
-        r'(pom \{[^}]*?)name = ""',
-        r'\1name = "Pulumi Webflow Provider"',
-        content,
-        count=1
-    )
-
-    # Fix URL placeholders
-    content = content.replace(
-        'url = "https://example.com"',
-        'url = "https://github.com/jdetmar/pulumi-webflow"'
-    )
-    content = content.replace(
-        'connection = "https://example.com"',
-        'connection = "scm:git:git://github.com/jdetmar/pulumi-webflow.git"'
-    )
-    content = content.replace(
-        'developerConnection = "https://example.com"',
-        'developerConnection = "scm:git:ssh://github.com:jdetmar/pulumi-webflow.git"'
-    )
+    content = _patch_in_block(content, (b'pom',), b'name', b'Pulumi Webflow Provider')
 
     # Fix license block - need to be careful not to match the pom name
-    # First fix license name
-    content = re.sub(
-        r'(licenses \{[^}]*?license \{[^}]*?)name = ""',
-        r'\1name = "Apache-2.0"',
-        content
-    )
-    # Then fix license url
-    content = re.sub(
-        r'(licenses \{[^}]*?license \{[^}]*?)url = ""',
-        r'\1url = "https://www.apache.org/licenses/LICENSE-2.0"',
-        content
-    )
+    content = _patch_in_block(content, (b'licenses', b'license'), b'name', b'Apache-2.0')
+    content = _patch_in_block(content, (b'licenses', b'license'), b'url', b'https://www.apache.org/licenses/LICENSE-2.0')
 
     # Fix developer block
-    content = re.sub(
-        r'(developers \{[^}]*?developer \{[^}]*?)id = ""',
-        r'\1id = "jdetmar"',
-        content
-    )
-    content = re.sub(
-        r'(developers \{[^}]*?developer \{[^}]*?)name = ""',
-        r'\1name = "Justin Detmar"',
-        content
-    )
-    content = re.sub(
-        r'(developers \{[^}]*?developer \{[^}]*?)email = ""',
-        r'\1email = "jdetmar@users.noreply.github.com"',
-        content
-    )
-
-    # Fix signing to use 3 parameters
-    content = content.replace(
-        'useInMemoryPgpKeys(signingKey, signingPassword)',
-        'useInMemoryPgpKeys(signingKeyId, signingKey, signingPassword)'
-    )
+    content = _patch_in_block(content, (b'developers', b'developer'), b'id', b'jdetmar')
+    content = _patch_in_block(content, (b'developers', b'developer'), b'name', b'Justin Detmar')
+    content = _patch_in_block(content, (b'developers', b'developer'), b'email', b'jdetmar@users.noreply.github.com')
 
     # Add nexusPublishing block if not present
-    if 'nexusPublishing {' not in content:
-        nexus_block = '''
+    if b'nexusPublishing {' not in content:
+        nexus_block = b'''
 if (publishRepoUsername) {
     nexusPublishing {
         repositories {
@@ -173,10 +213,12 @@ if (publishRepoUsername) {
 }
 '''
         # Find the end of the publishing block and add nexusPublishing after it
-        # Look for the closing brace of the publishing block
-        publishing_match = re.search(r'(publishing \{.*?^\})\s*\n', content, re.MULTILINE | re.DOTALL)
-        if publishing_match:
-            insert_pos = publishing_match.end()
+        # (past any blank lines that follow its closing brace)
+        publishing_start = content.find(b'publishing {')
+        publishing_end = _find_block_end(content, publishing_start) if publishing_start >= 0 else -1
+        if publishing_end >= 0:
+            blank_lines = _TRAILING_BLANK_LINES_RE.match(content, publishing_end)
+            insert_pos = blank_lines.end() if blank_lines else publishing_end
             content = content[:insert_pos] + nexus_block + content[insert_pos:]
         else:
             raise PatchError(
@@ -185,17 +227,27 @@ if (publishRepoUsername) {
                 f"File: {filepath}"
             )
 
-    # Write the patched content
+    # Leave the file untouched when there is nothing to patch
+    if content == original_content:
+        print(f"No changes needed for {filepath} (already patched)")
+        return
+
+    # Write the patched content to a sibling temp file and swap it into place,
+    # so an interrupted run never leaves a truncated build.gradle behind
+    tmp_path = path.with_name(path.name + '.tmp')
     try:
-        path.write_text(content, encoding='utf-8')
+        tmp_path.write_bytes(content)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
     except PermissionError:
+        tmp_path.unlink(missing_ok=True)
         raise PermissionError(f"Cannot write to build.gradle (permission denied): {filepath}")
+    except OSError:
+        # Don't leave a stray temp file in the SDK tree (e.g. disk full)
+        tmp_path.unlink(missing_ok=True)
+        raise
 
-    # Report what was done
-    if content == original_content:
-        print(f"No changes needed for {filepath} (already patched)")
-    else:
-        print(f"Successfully patched {filepath}")
+    print(f"Successfully patched {filepath}")
 
 
 def main() -> int: